@@ -4,11 +4,15 @@ This module is responsible for creating the Flask application and configuring va
 2. Swagger UI (API Documentation)
 3. Blueprints for different controllers and explorers
 4. Loading environment variables from a .env file
+
+The app can be started in one of three roles (see `create_app`), so read-only API replicas
+do not import the crawler or run background jobs:
+- **api**: Explorer endpoints and Swagger UI only.
+- **worker**: Controller endpoints (crawl triggers, scheduler settings) and the crawl scheduler.
+- **all**: Everything in a single process (the default).
 """
 
 from flask import Flask
-from app.controller_api.controller import controller as controller_bp
-from app.explorer_api.explorer import explorer as explorer_bp
 from app.db.models import db
 from dotenv import load_dotenv
 import os
@@ -18,7 +22,14 @@ from flask_swagger_ui import get_swaggerui_blueprint
 # Load environment variables from the .env file
 load_dotenv()
 
-def create_app():
+# Roles the app can be started in, and whether each one serves the explorer / controller APIs
+ROLES = {
+    "api": {"explorer": True, "controller": False},
+    "worker": {"explorer": False, "controller": True},
+    "all": {"explorer": True, "controller": True},
+}
+
+def create_app(role=None):
     """
     Factory function to create the Flask application instance.
 
@@ -28,14 +39,24 @@ def create_app():
     3. SQLAlchemy for database interactions
     4. Blueprints for routing API endpoints
 
+    Blueprints are imported lazily, so the crawler (requests, BeautifulSoup, lxml) is only
+    loaded when the role serves the controller API.
+
+    :param role: One of "api", "worker" or "all". Defaults to the APP_ROLE setting.
+
     Returns:
         app: The Flask application instance
     """
+    role = role or Config.APP_ROLE
+    if role not in ROLES:
+        raise ValueError(f"Unknown app role '{role}', expected one of: {', '.join(ROLES)}")
+
     # Initialize the Flask application
     app = Flask(__name__, static_folder='static')
 
     # Load app configurations from Config class
     app.config.from_object(Config)
+    app.config['APP_ROLE'] = role
 
     # Swagger UI setup for API documentation
     SWAGGER_URL = '/swagger'  # URL to access Swagger UI
@@ -58,8 +79,12 @@ def create_app():
     db.init_app(app)
 
     # Register application blueprints for routing different parts of the API
-    app.register_blueprint(controller_bp, url_prefix="/controller")
-    app.register_blueprint(explorer_bp)
+    if ROLES[role]["controller"]:
+        from app.controller_api.controller import controller as controller_bp
+        app.register_blueprint(controller_bp, url_prefix="/controller")
+    if ROLES[role]["explorer"]:
+        from app.explorer_api.explorer import explorer as explorer_bp
+        app.register_blueprint(explorer_bp)
     app.register_blueprint(swagger_ui_blueprint, url_prefix=SWAGGER_URL)  # Register Swagger UI blueprint
 
     return app
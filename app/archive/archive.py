@@ -0,0 +1,192 @@
+"""
+This module moves cold article versions out of the hot `article_versions` table.
+
+- Versions crawled more than ARCHIVE_MAX_AGE_DAYS ago are written to gzip-compressed JSONL
+  segment files under ARCHIVE_DIR, one segment per article and archive run.
+- Each segment is indexed in the `archive_segments` table, so reads only open the files of
+  the requested article.
+- The latest version of every article always stays in the hot table, because the crawler
+  compares new content against it and the search endpoint only looks at latest versions.
+"""
+
+import gzip
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import func, select
+from app.db.models import db, ArticleVersion, ArchiveSegment
+
+# Columns of article_versions that hold datetimes, stored as ISO 8601 strings in the segments
+DATETIME_COLUMNS = ("last_updated", "crawled_at")
+
+
+class ArchiveReadError(Exception):
+    """Raised when an indexed segment file is missing, unreadable or corrupt."""
+
+
+def _archive_dir():
+    return current_app.config.get("ARCHIVE_DIR", "archive")
+
+
+def _write_segment(relative_path, versions):
+    """
+    Writes the versions to a gzip-compressed JSONL file via a temporary file, so readers never
+    see a partial segment. `relative_path` must be unique to the archive run.
+    """
+    path = os.path.join(_archive_dir(), relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = path + ".tmp"
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as segment:
+            for version in versions:
+                segment.write(json.dumps(version, default=lambda value: value.isoformat()) + "\n")
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def _read_segment(relative_path):
+    """
+    Returns the versions stored in a segment file, with datetime columns parsed back.
+    Raises ArchiveReadError if the file cannot be read.
+    """
+    path = os.path.join(_archive_dir(), relative_path)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as segment:
+            versions = [json.loads(line) for line in segment]
+    except (OSError, EOFError, ValueError) as exc:
+        # gzip.BadGzipFile is an OSError, truncated files raise EOFError, bad JSON a ValueError
+        logging.error(f"Failed to read archive segment {path}: {type(exc).__name__}: {exc}")
+        raise ArchiveReadError(f"Archive segment {relative_path} is unavailable") from exc
+
+    for version in versions:
+        for column in DATETIME_COLUMNS:
+            if version.get(column):
+                version[column] = datetime.fromisoformat(version[column])
+    return versions
+
+
+# --- Move old versions into archive segments ---
+def archive_old_versions(max_age_days=None, now=None):
+    """
+    Archives every version crawled more than `max_age_days` ago (ARCHIVE_MAX_AGE_DAYS by default),
+    except the latest version of each article.
+
+    Articles are archived one at a time, each in its own transaction: the segment file is written
+    first, under a name unique to this run, then the index row is added and the versions are
+    deleted from the hot table. The delete claims the versions: if another run has already
+    archived (deleted) some of them, fewer rows are deleted than were written, so this run rolls
+    back and removes only its own file. If the commit fails, the file is removed as well.
+
+    Returns the number of articles and versions that were archived by this run.
+    """
+    run_id = uuid.uuid4().hex[:12]
+    if max_age_days is None:
+        max_age_days = current_app.config.get("ARCHIVE_MAX_AGE_DAYS", 365)
+    cutoff = (now or datetime.utcnow()) - timedelta(days=max_age_days)
+
+    latest = (
+        select(
+            ArticleVersion.article_id,
+            func.max(ArticleVersion.version_number).label("max_version")
+        )
+        .group_by(ArticleVersion.article_id)
+        .subquery()
+    )
+    cold_filter = (
+        (ArticleVersion.article_id == latest.c.article_id) &
+        (ArticleVersion.version_number < latest.c.max_version) &
+        (ArticleVersion.crawled_at < cutoff)
+    )
+
+    article_ids = db.session.execute(
+        select(ArticleVersion.article_id).distinct().join(latest, cold_filter)
+    ).scalars().all()
+
+    archived_articles = 0
+    archived_versions = 0
+    for article_id in article_ids:
+        result = db.session.execute(
+            select(ArticleVersion.__table__)
+            .join(latest, cold_filter)
+            .where(ArticleVersion.article_id == article_id)
+            .order_by(ArticleVersion.version_number.asc())
+        )
+        versions = [dict(row) for row in result.mappings()]
+        if not versions:
+            continue  # Archived by a concurrent run since the article ids were selected
+        min_version = versions[0]["version_number"]
+        max_version = versions[-1]["version_number"]
+
+        relative_path = os.path.join(
+            str(article_id), f"v{min_version:06d}-v{max_version:06d}-{run_id}.jsonl.gz"
+        )
+        path = _write_segment(relative_path, versions)
+
+        try:
+            deleted = db.session.execute(
+                ArticleVersion.__table__.delete()
+                .where(ArticleVersion.id.in_([version["id"] for version in versions]))
+            ).rowcount
+            if deleted != len(versions):
+                db.session.rollback()
+                os.remove(path)
+                logging.info(f"Versions of article {article_id} were archived by a concurrent run. Skipping.")
+                continue
+
+            db.session.add(ArchiveSegment(
+                article_id=article_id,
+                path=relative_path,
+                min_version=min_version,
+                max_version=max_version,
+                version_count=len(versions),
+            ))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            os.remove(path)
+            raise
+
+        archived_articles += 1
+        archived_versions += len(versions)
+        logging.info(f"Archived versions {min_version}-{max_version} of article {article_id} to {relative_path}")
+
+    return {"articles": archived_articles, "versions": archived_versions}
+
+
+# --- Read archived versions ---
+def load_archived_versions(article_id, columns=None, newest=None):
+    """
+    Returns the archived versions of an article as dicts, ordered by version number.
+    Raises ArchiveReadError if one of the article's segment files cannot be read.
+
+    :param columns: Only include these keys in each dict (all columns if None).
+    :param newest: Only return the `newest` highest version numbers; segments are read
+        newest-first and reading stops as soon as enough versions have been found.
+    """
+    segments = (
+        ArchiveSegment.query
+        .filter_by(article_id=article_id)
+        .order_by(ArchiveSegment.max_version.desc())
+        .all()
+    )
+
+    versions = []
+    for segment in segments:
+        if newest is not None and len(versions) >= newest:
+            break
+        versions.extend(_read_segment(segment.path))
+
+    versions.sort(key=lambda version: version["version_number"])
+    if newest is not None:
+        versions = versions[-newest:] if newest else []
+    if columns is not None:
+        versions = [{column: version.get(column) for column in columns} for version in versions]
+    return versions
@@ -3,11 +3,25 @@ This module handles all the logic for managing the crawling process and scheduli
 
 - Triggers a full crawl of all articles.
 - Triggers the crawl of an individual article by its URL.
+- Triggers the recrawl of a batch of articles by their URLs.
+- Triggers archiving of old article versions.
 - Retrieves and updates the scheduler settings for periodic crawling.
 """
 
-from flask import Blueprint, jsonify, request
-from app.crawler.crawler import start_full_crawl, crawl_article_page, store_article_and_versions
+import json
+import logging
+from contextlib import closing
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from app.crawler.crawler import (
+    ArticleParseError,
+    crawl_article_page,
+    quarantine_url,
+    recrawl_articles,
+    release_url,
+    start_full_crawl,
+    store_article_and_versions,
+)
+from app.archive.archive import archive_old_versions
 from app.db.models import SchedulerSettings, db
 
 # Blueprint to handle routes for crawling and scheduler settings
@@ -31,20 +45,112 @@ def trigger_article_crawl():
     Triggers the crawl of an individual article by its URL. The URL is passed as JSON in the request body.
     The function fetches the article's content, extracts key data (headline, subheadline, body),
     and stores it in the database if new or updated.
+
+    A failing URL is quarantined, and a successful crawl releases it from quarantine.
     """
     data = request.get_json()
     url = data.get("url")
     if not url:
         return jsonify({"error": "URL is required"}), 400
 
-    article_data = crawl_article_page(url)
+    try:
+        article_data = crawl_article_page(url)
+    except ArticleParseError as exc:
+        quarantine_url(url, type(exc).__name__, str(exc))
+        db.session.commit()
+        return jsonify({"error": "Failed to parse the article", "reason": str(exc)}), 422
+    except Exception as exc:
+        # Fetch errors such as invalid URLs, connection errors or timeouts
+        quarantine_url(url, type(exc).__name__, str(exc))
+        db.session.commit()
+        return jsonify({"error": "Failed to crawl the article", "reason": f"{type(exc).__name__}: {exc}"}), 500
+
     if not article_data:
+        quarantine_url(url, "FetchError", "Failed to crawl the article")
+        db.session.commit()
         return jsonify({"error": "Failed to crawl the article"}), 500
 
+    release_url(url)
     store_article_and_versions(article_data)
     return jsonify({"message": "Article crawled and stored."}), 200
 
 
+# --- Trigger crawl of a batch of articles ---
+@controller.route("/crawl/articles", methods=["POST"])
+def trigger_batch_article_crawl():
+    """
+    Recrawls a list of articles by their URLs. The URLs are passed as JSON in the request body
+    (`{"urls": [...], "stream": false}`). Pages are fetched concurrently and all changes are
+    stored in a single transaction.
+
+    Returns one outcome per URL ("changed", "unchanged" or "failed" with a reason). If `stream`
+    is true, outcomes are streamed as newline-delimited JSON as soon as each URL is processed.
+    Fetch failures are streamed as they happen, the remaining outcomes once they are committed.
+    The stream ends with a `{"committed": true}` record, or `{"committed": false, "error": ...}`
+    if the transaction was rolled back.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"error": "A non-empty list of URLs is required"}), 400
+
+    urls = data.get("urls")
+    if not isinstance(urls, list) or not urls or not all(isinstance(url, str) and url for url in urls):
+        return jsonify({"error": "A non-empty list of URLs is required"}), 400
+
+    max_urls = current_app.config.get("CRAWL_BATCH_MAX_URLS", 500)
+    if len(urls) > max_urls:
+        return jsonify({"error": f"At most {max_urls} URLs can be crawled per request"}), 400
+
+    # Drop duplicate URLs while keeping the original order
+    urls = list(dict.fromkeys(urls))
+    max_workers = current_app.config.get("CRAWL_BATCH_MAX_WORKERS", 8)
+
+    if data.get("stream"):
+        def generate():
+            # closing() makes sure a client disconnect also closes (and rolls back) the recrawl
+            with closing(recrawl_articles(urls, max_workers=max_workers)) as outcomes:
+                try:
+                    for outcome in outcomes:
+                        yield json.dumps(outcome) + "\n"
+                except Exception as exc:
+                    logging.exception("Batch article crawl was rolled back")
+                    yield json.dumps({"committed": False, "error": f"{type(exc).__name__}: {exc}"}) + "\n"
+                    return
+
+            yield json.dumps({"committed": True}) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+    # Outcomes arrive in completion order; return them in request order instead
+    position = {url: index for index, url in enumerate(urls)}
+    results = sorted(recrawl_articles(urls, max_workers=max_workers), key=lambda outcome: position[outcome["url"]])
+    summary = {status: 0 for status in ("changed", "unchanged", "failed")}
+    for outcome in results:
+        summary[outcome["status"]] += 1
+
+    return jsonify({"results": results, "summary": summary}), 200
+
+
+# --- Archive old article versions ---
+@controller.route("/archive", methods=["POST"])
+def trigger_archive():
+    """
+    Moves article versions older than 'max_age_days' (ARCHIVE_MAX_AGE_DAYS by default) from the
+    database into compressed archive files. The latest version of every article is always kept.
+    Archived versions are still returned by the explorer endpoints.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "'max_age_days' must be a non-negative integer"}), 400
+
+    max_age_days = data.get("max_age_days")
+    if max_age_days is not None and (not isinstance(max_age_days, int) or isinstance(max_age_days, bool) or max_age_days < 0):
+        return jsonify({"error": "'max_age_days' must be a non-negative integer"}), 400
+
+    archived = archive_old_versions(max_age_days=max_age_days)
+    return jsonify({"message": "Old versions archived.", **archived}), 200
+
+
 # --- Get or update scheduler settings ---
 @controller.route("/scheduler/settings", methods=["PUT", "GET"])
 def manage_scheduler_settings():
@@ -4,25 +4,28 @@ This module handles all the crawling logic for the Tagesschau site.
 - Crawls the overview page to grab all article URLs.
 - Visits each article and extracts key data (headline, subheadline, body).
 - Saves data in DB, with versioning so we don't store duplicates.
+- Recrawls a batch of article URLs concurrently and stores them in one transaction.
+- Quarantines URLs that fail to crawl, so they are retried with a backoff instead of on every run.
 """
 
 import requests
 from bs4 import BeautifulSoup
-from app.db.models import db, Article, ArticleVersion
-from datetime import datetime
+from flask import current_app
+from app.db.models import db, Article, ArticleVersion, QuarantinedUrl
+from datetime import datetime, timedelta
 from hashlib import md5
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 import os
 import json
 import logging
 
-# Basic logging to track the crawler's activity
-logging.basicConfig(level=logging.INFO)
+# Base URL comes from environment config (loaded from .env by `config`) to avoid hardcoding the value
+BASE_URL = os.getenv("BASE_URL")
 
-load_dotenv()
 
-# Base URL comes from environment config to avoid hardcoding the value
-BASE_URL = os.getenv("BASE_URL")
+class ArticleParseError(Exception):
+    """Raised when an article page is missing the data we need to store it."""
 
 # --- Crawl the overview page to collect article URLs ---
 def crawl_links_overview_page():
@@ -30,7 +33,7 @@ def crawl_links_overview_page():
     Makes a GET request to the overview page and scrapes all article URLs using BeautifulSoup.
     We search for anchor tags with class 'teaser__link' to get the article links.
     """
-    response = requests.get(BASE_URL)
+    response = requests.get(BASE_URL, timeout=current_app.config.get("CRAWL_REQUEST_TIMEOUT_SECONDS", 10))
     if response.status_code != 200:
         print("Failed")
         return []
@@ -49,25 +52,73 @@ def crawl_links_overview_page():
 
 
 # --- Crawl individual article pages ---
-def crawl_article_page(url):
+def _meta_content(soup, prop):
+    """Returns the stripped content of a <meta property=...> tag, or None if it is missing or empty."""
+    tag = soup.find("meta", property=prop)
+    content = tag.get("content") if tag else None
+    return content.strip() if content and content.strip() else None
+
+
+def _iter_json_ld_items(data):
+    """Yields every JSON-LD object in `data`, flattening top-level lists and @graph containers."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_items(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld_items(data["@graph"])
+
+
+def _extract_article_body(soup):
+    """
+    Returns the article body from the first JSON-LD block that has one. Pages can carry several
+    ld+json blocks (breadcrumbs, video objects, ...), and malformed blocks are skipped.
+    """
+    for script_tag in soup.find_all("script", type="application/ld+json"):
+        try:
+            article_json = json.loads(script_tag.string or "")
+        except ValueError:
+            continue
+
+        for item in _iter_json_ld_items(article_json):
+            article_body = item.get("articleBody")
+            if isinstance(article_body, str) and article_body.strip():
+                return article_body.strip()
+
+    return ""
+
+
+def crawl_article_page(url, timeout=None):
     """
     Given a URL, fetches the article page and extracts important information like 
     headline, subheadline, and the article body. The article body is taken from 
     the JSON-LD structured data tag, which is more reliable than parsing HTML directly.
+
+    Returns an empty list if the page could not be fetched, and raises ArticleParseError
+    if it has no headline or article body (e.g. live blogs or video pages). `timeout` defaults
+    to CRAWL_REQUEST_TIMEOUT_SECONDS; pass it explicitly when calling outside an app context.
     """
-    response = requests.get(url)
+    if timeout is None:
+        timeout = current_app.config.get("CRAWL_REQUEST_TIMEOUT_SECONDS", 10)
+    response = requests.get(url, timeout=timeout)
     if response.status_code != 200:
         return []
     
     soup = BeautifulSoup(response.text, "lxml")
 
-    headline = soup.find("meta", property="og:title")["content"]
-    subheadline = soup.find("meta", property="og:description")["content"]
+    headline = _meta_content(soup, "og:title")
+    if not headline and soup.title and soup.title.string:
+        headline = soup.title.string.strip()
+    subheadline = _meta_content(soup, "og:description")
 
     # The full article text is embedded in a JSON-LD structured data tag
-    script_tag = soup.find("script", type="application/ld+json")
-    article_json = json.loads(script_tag.string)
-    full_text = article_json.get("articleBody", "").strip()
+    full_text = _extract_article_body(soup)
+
+    if not headline:
+        raise ArticleParseError(f"No headline found on {url}")
+    if not full_text:
+        raise ArticleParseError(f"No articleBody found in JSON-LD on {url}")
 
     last_updated = datetime.now()
 
@@ -80,11 +131,49 @@ def crawl_article_page(url):
     }
 
 
+# --- Quarantine failing URLs ---
+def quarantine_url(url, error_type, error_message):
+    """
+    Records a failed crawl of `url` in the current session without committing. Each consecutive
+    failure doubles the backoff before the URL is crawled again, up to QUARANTINE_MAX_BACKOFF_HOURS.
+    """
+    base_backoff_hours = current_app.config.get("QUARANTINE_BASE_BACKOFF_HOURS", 1)
+    max_backoff_hours = current_app.config.get("QUARANTINE_MAX_BACKOFF_HOURS", 168)
+
+    now = datetime.utcnow()
+    entry = QuarantinedUrl.query.filter_by(url=url).first()
+    if entry:
+        entry.failure_count += 1
+    else:
+        entry = QuarantinedUrl(url=url, failure_count=1, first_failed_at=now)
+        db.session.add(entry)
+
+    backoff_hours = min(base_backoff_hours * 2 ** (entry.failure_count - 1), max_backoff_hours)
+    entry.error_type = error_type
+    entry.error_message = error_message
+    entry.last_failed_at = now
+    entry.next_retry_at = now + timedelta(hours=backoff_hours)
+    logging.warning(f"Quarantined {url} after {entry.failure_count} failure(s) ({error_type}): retry after {entry.next_retry_at}")
+    return entry
+
+
+def release_url(url):
+    """Removes `url` from the quarantine (in the current session) after a successful crawl."""
+    QuarantinedUrl.query.filter_by(url=url).delete()
+
+
+def quarantined_urls(now=None):
+    """Returns the set of URLs whose backoff has not expired yet."""
+    now = now or datetime.utcnow()
+    rows = db.session.query(QuarantinedUrl.url).filter(QuarantinedUrl.next_retry_at > now).all()
+    return {row.url for row in rows}
+
+
 # --- Store article and version changes ---
-def store_article_and_versions(article_data):
+def _stage_article_version(article_data):
     """
-    Saves the article to the database and adds a new version if the content has changed.
-    We use a hash of the article text to check if the content has changed.
+    Adds the article and, if its content has changed, a new version to the current session
+    without committing. Returns "changed", "unchanged", or None if the data is incomplete.
     """
     url = article_data.get("url")
     headline = article_data.get("headline")
@@ -94,16 +183,16 @@ def store_article_and_versions(article_data):
 
     if not url or not full_text:
         logging.info("Missing URL or full_text. Skipping article.")
-        return
+        return None
 
     # Check if the article already exists in the database
     article = Article.query.filter_by(url=url).first()
 
-    # If article doesn't exist, create a new one
+    # If article doesn't exist, create a new one (flushed so it gets an id)
     if not article:
         article = Article(url=url)
         db.session.add(article)
-        db.session.commit()
+        db.session.flush()
         logging.info(f"New article created: {url}")
 
     # Hash the content to compare if it has changed
@@ -120,7 +209,7 @@ def store_article_and_versions(article_data):
     # If the content hasn't changed, skip creating a new version
     if previous_version and previous_version.content_hash == current_hash:
         logging.info(f"Article {url} has no changes. Skipping versioning.")
-        return
+        return "unchanged"
 
     # Get the last version number to create the next version
     last_version = (
@@ -143,8 +232,98 @@ def store_article_and_versions(article_data):
     )
 
     db.session.add(article_version)
-    db.session.commit()
+    db.session.flush()
     logging.info(f"New version {new_version_number} added for article: {url}")
+    return "changed"
+
+
+def store_article_and_versions(article_data):
+    """
+    Saves the article to the database and adds a new version if the content has changed.
+    We use a hash of the article text to check if the content has changed.
+    """
+    outcome = _stage_article_version(article_data)
+    db.session.commit()
+    return outcome
+
+
+# --- Crawl several article pages concurrently ---
+def crawl_article_pages(urls, max_workers=8):
+    """
+    Fetches several article pages concurrently, with at most `max_workers` requests in flight.
+    Yields `(url, article_data, error_type, error)` tuples in completion order. When the page
+    could not be fetched or parsed, `error_type` names the failure and `error` is a short reason
+    string; both are None otherwise.
+
+    If the generator is closed early, pending fetches are cancelled instead of waited for.
+    """
+    # Worker threads have no app context, so the timeout is resolved here
+    timeout = current_app.config.get("CRAWL_REQUEST_TIMEOUT_SECONDS", 10)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(crawl_article_page, url, timeout): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                article_data = future.result()
+            except Exception as exc:
+                yield url, None, type(exc).__name__, f"{type(exc).__name__}: {exc}"
+                continue
+
+            if not article_data:
+                yield url, None, "FetchError", "Failed to crawl the article"
+            else:
+                yield url, article_data, None, None
+    finally:
+        # On GeneratorExit (e.g. a client disconnect) don't block until the whole batch is fetched
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Recrawl a batch of articles ---
+def recrawl_articles(urls, max_workers=8):
+    """
+    Recrawls the given article URLs concurrently and stores all changes in a single transaction.
+
+    Yields one outcome dict per URL, with a `status` of "changed", "unchanged" or "failed" (plus
+    a `reason` for failures). Pages are fetched in worker threads first, and fetch failures are
+    yielded as they happen. The fetched pages are then stored in one short transaction, so no
+    database lock is held while waiting on the network, and their outcomes are yielded once it
+    has been committed. If the commit fails, or the generator is closed early (e.g. a streaming
+    client disconnects), nothing is stored.
+
+    Failing URLs are quarantined (committed immediately, independent of the batch), and
+    succeeding ones released, but quarantined URLs are not skipped since the batch is an
+    explicit request to recrawl them.
+    """
+    fetched = []
+    # closing() cancels the pending fetches right away if this generator is closed early
+    with closing(crawl_article_pages(urls, max_workers=max_workers)) as pages:
+        for url, article_data, error_type, error in pages:
+            if error:
+                # Committed right away, so the quarantine survives a rollback of the batch
+                quarantine_url(url, error_type, error)
+                db.session.commit()
+                yield {"url": url, "status": "failed", "reason": error}
+            else:
+                fetched.append(article_data)
+
+    outcomes = []
+    try:
+        for article_data in fetched:
+            url = article_data["url"]
+            outcome = _stage_article_version(article_data)
+            if outcome is None:
+                outcomes.append({"url": url, "status": "failed", "reason": "Missing URL or full_text"})
+            else:
+                release_url(url)
+                outcomes.append({"url": url, "status": outcome})
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    yield from outcomes
 
 
 # --- Entrypoint to run the full crawling process ---
@@ -152,13 +331,36 @@ def start_full_crawl():
     """
     Runs the entire crawl process:
     1. Collect article links from the overview page.
-    2. Visit each article page.
+    2. Visit each article page, skipping URLs that are still quarantined.
     3. If the article has changed, save the new version to the database.
+
+    A failing article never aborts the run: fetch and parse errors put the URL into
+    quarantine, and any other error is logged before moving on to the next URL.
     """
     logging.info("Full crawl started at: %s", datetime.now())
     article_links = crawl_links_overview_page()
+    skipped = quarantined_urls()
 
     for article_url in article_links:
-        article_data = crawl_article_page(article_url)
-        if article_data:
+        if article_url in skipped:
+            logging.info(f"Article {article_url} is quarantined. Skipping.")
+            continue
+
+        try:
+            article_data = crawl_article_page(article_url)
+        except Exception as exc:
+            quarantine_url(article_url, type(exc).__name__, str(exc))
+            db.session.commit()
+            continue
+
+        if not article_data:
+            quarantine_url(article_url, "FetchError", "Failed to crawl the article")
+            db.session.commit()
+            continue
+
+        try:
+            release_url(article_url)
             store_article_and_versions(article_data)
+        except Exception:
+            db.session.rollback()
+            logging.exception(f"Failed to store article {article_url}")
@@ -4,6 +4,8 @@ This module defines the database models for the crawling system.
 - **Article**: Represents a single article, including its URL and relationships to versions.
 - **ArticleVersion**: Represents a version of an article, including metadata like headline, subheadline, and full text.
 - **SchedulerSettings**: Stores settings for the crawling schedule, including frequency and status.
+- **QuarantinedUrl**: Records article URLs that repeatedly fail to crawl, so they are retried with a backoff.
+- **ArchiveSegment**: Indexes the compressed files that hold archived (cold) article versions.
 """
 
 from flask_sqlalchemy import SQLAlchemy
@@ -91,3 +93,59 @@ class SchedulerSettings(db.Model):
         """
         self.frequency_hours = frequency_hours
         self.is_enabled = is_enabled
+
+
+# --- QuarantinedUrl Model ---
+class QuarantinedUrl(db.Model):
+    """
+    Records an article URL that failed to be fetched or parsed, so the crawler can skip it
+    until its backoff has expired instead of retrying it on every run.
+
+    - **id**: Unique identifier for the quarantine entry.
+    - **url**: The URL of the failing article, must be unique.
+    - **error_type**: The type of the last error (e.g. the exception class name).
+    - **error_message**: The message of the last error.
+    - **failure_count**: How many times in a row crawling this URL has failed.
+    - **first_failed_at**: The time of the first failure in the current streak.
+    - **last_failed_at**: The time of the most recent failure.
+    - **next_retry_at**: The crawler skips the URL until this time has passed.
+    """
+    __tablename__ = 'quarantined_urls'
+
+    id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String, unique=True, nullable=False)
+    error_type = db.Column(db.String, nullable=False)
+    error_message = db.Column(db.Text)
+    failure_count = db.Column(db.Integer, nullable=False, default=1)
+    first_failed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_failed_at = db.Column(db.DateTime, default=datetime.utcnow)
+    next_retry_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (db.Index('ix_quarantined_url_next_retry_at', 'next_retry_at'),)
+
+
+# --- ArchiveSegment Model ---
+class ArchiveSegment(db.Model):
+    """
+    Indexes a compressed segment file holding archived versions of one article. Old versions are
+    moved out of `article_versions` into these files to keep the hot table small.
+
+    - **id**: Unique identifier for the segment.
+    - **article_id**: The ID of the article whose versions the segment holds.
+    - **path**: Path of the gzip-compressed JSONL file, relative to ARCHIVE_DIR.
+    - **min_version**: The lowest version number stored in the segment.
+    - **max_version**: The highest version number stored in the segment.
+    - **version_count**: How many versions the segment holds.
+    - **archived_at**: The time when the segment was written.
+    """
+    __tablename__ = 'archive_segments'
+
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.id'), nullable=False)
+    path = db.Column(db.String, unique=True, nullable=False)
+    min_version = db.Column(db.Integer, nullable=False)
+    max_version = db.Column(db.Integer, nullable=False)
+    version_count = db.Column(db.Integer, nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (db.Index('ix_archive_segment_article_id_max_version', 'article_id', 'max_version'),)
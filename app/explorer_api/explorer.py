@@ -5,16 +5,63 @@ This module defines the routes for exploring articles and their versions.
 - **/explorer/articles/<article_id>/versions**: Retrieves all versions of a specific article.
 - **/explorer/articles/<article_id>/compare**: Compares the two most recent versions of a specific article.
 - **/explorer/articles/search**: Searches for articles based on keywords in the headline, subheadline, or full text of their latest versions.
+
+These routes are read-heavy, so they select only the columns they return as plain rows instead of
+loading full ORM objects, and serialize them with orjson when it is installed.
+
+Versions moved to the archive (see `app.archive.archive`) are merged back in by the versions and
+compare routes. Search only looks at latest versions, which are never archived.
 """
 
-from flask import Blueprint, jsonify, request
+import json
+from flask import Blueprint, Response, request
 from app.db.models import Article, ArticleVersion
-from sqlalchemy import func
+from sqlalchemy import func, select
 from app.db.models import db
+from app.archive.archive import ArchiveReadError, load_archived_versions
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, fall back to the standard library
+    orjson = None
 
 # Initialize the blueprint for exploring articles
 explorer = Blueprint("explorer", __name__)
 
+
+def _fetch_dicts(statement):
+    """Executes a core SELECT and returns its rows as plain dicts keyed by column label."""
+    result = db.session.execute(statement)
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def _merge_versions(hot_versions, archived_versions):
+    """
+    Merges hot and archived versions into one list ordered by version number. The hot table is
+    read first, so versions archived in between show up in both lists; they are de-duplicated
+    by version number.
+    """
+    merged = {version["version_number"]: version for version in archived_versions}
+    merged.update((version["version_number"], version) for version in hot_versions)
+    return [merged[number] for number in sorted(merged)]
+
+
+def _archive_unavailable():
+    return json_response({"error": "Archived versions of this article are unavailable"}, 503)
+
+
+def json_response(payload, status=200):
+    """
+    Serializes `payload` to a JSON response, using orjson if available. Datetimes are
+    rendered in ISO 8601 format, the same as `datetime.isoformat()`.
+    """
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, default=lambda value: value.isoformat())
+    return Response(body, status=status, mimetype="application/json")
+
 # --- Route to List All Articles ---
 @explorer.route("/explorer/articles", methods=["GET"])
 def list_articles():
@@ -24,15 +71,8 @@ def list_articles():
     Returns a list of articles with their ID and URL.
 
     """
-    articles = Article.query.all()
-    result = [
-        {
-            "id": article.id,
-            "url": article.url,
-        }
-        for article in articles
-    ]
-    return jsonify(result), 200
+    result = _fetch_dicts(select(Article.id, Article.url))
+    return json_response(result, 200)
 
 
 # --- Route to Get Versions of an Article ---
@@ -45,28 +85,32 @@ def get_article_versions(article_id):
     last update time, and crawl timestamp.
 
     """
-    versions = (
-        ArticleVersion.query
-        .filter_by(article_id=article_id)
+    # Only the returned columns are loaded; full_text in particular is never read here
+    columns = (
+        ArticleVersion.id,
+        ArticleVersion.version_number,
+        ArticleVersion.headline,
+        ArticleVersion.subheadline,
+        ArticleVersion.last_updated,
+        ArticleVersion.crawled_at,
+    )
+    hot_versions = _fetch_dicts(
+        select(*columns)
+        .where(ArticleVersion.article_id == article_id)
         .order_by(ArticleVersion.version_number.asc())
-        .all()
     )
 
-    if not versions:
-        return jsonify({"error": "No versions found for this article"}), 404
+    try:
+        archived_versions = load_archived_versions(article_id, columns=[column.key for column in columns])
+    except ArchiveReadError:
+        return _archive_unavailable()
+
+    result = _merge_versions(hot_versions, archived_versions)
+
+    if not result:
+        return json_response({"error": "No versions found for this article"}, 404)
 
-    result = [
-        {
-            "id": version.id,
-            "version_number": version.version_number,
-            "headline": version.headline,
-            "subheadline": version.subheadline,
-            "last_updated": version.last_updated.isoformat(),
-            "crawled_at": version.crawled_at.isoformat(),
-        }
-        for version in versions
-    ]
-    return jsonify(result), 200
+    return json_response(result, 200)
 
 
 # --- Route to Compare Two Versions of an Article ---
@@ -80,38 +124,42 @@ def compare_article_versions(article_id):
 
     """
     # Get the two latest versions for the article
-    latest_versions = (
-        ArticleVersion.query
-        .filter_by(article_id=article_id)
+    columns = (
+        ArticleVersion.version_number,
+        ArticleVersion.headline,
+        ArticleVersion.subheadline,
+        ArticleVersion.full_text,
+    )
+    latest_versions = _fetch_dicts(
+        select(*columns)
+        .where(ArticleVersion.article_id == article_id)
         .order_by(ArticleVersion.version_number.desc())
         .limit(2)  # Limited to 2 most recent versions
-        .all()
     )
 
+    # Fall back to the archive if the hot table only holds the latest version
     if len(latest_versions) < 2:
-        return jsonify({"error": "Not enough versions to compare"}), 404
+        try:
+            archived_versions = load_archived_versions(
+                article_id,
+                columns=[column.key for column in columns],
+                newest=2,
+            )
+        except ArchiveReadError:
+            return _archive_unavailable()
+
+        latest_versions = _merge_versions(latest_versions, archived_versions)[::-1][:2]
 
-    # Extract the two versions
-    version_1 = latest_versions[0]
-    version_2 = latest_versions[1]
+    if len(latest_versions) < 2:
+        return json_response({"error": "Not enough versions to compare"}, 404)
 
     # Return the comparison of the two versions
     comparison = {
-        "version_1": {
-            "version_number": version_1.version_number,
-            "headline": version_1.headline,
-            "subheadline": version_1.subheadline,
-            "full_text": version_1.full_text,
-        },
-        "version_2": {
-            "version_number": version_2.version_number,
-            "headline": version_2.headline,
-            "subheadline": version_2.subheadline,
-            "full_text": version_2.full_text,
-        },
+        "version_1": latest_versions[0],
+        "version_2": latest_versions[1],
     }
 
-    return jsonify(comparison), 200
+    return json_response(comparison, 200)
 
 
 # --- Route to Search Articles ---
@@ -125,7 +173,7 @@ def search_articles():
     """
     keyword = request.args.get("q", "").strip()
     if not keyword:
-        return jsonify({"error": "Query parameter 'q' is required."}), 400
+        return json_response({"error": "Query parameter 'q' is required."}, 400)
 
     # Subquery to get the most recent version of each article
     subquery = (
@@ -138,32 +186,26 @@ def search_articles():
     )
 
     # Join to get the latest version details
-    latest_versions = (
-        db.session.query(ArticleVersion)
+    result = _fetch_dicts(
+        select(
+            ArticleVersion.article_id,
+            ArticleVersion.version_number,
+            ArticleVersion.headline,
+            ArticleVersion.subheadline,
+            ArticleVersion.full_text,
+            ArticleVersion.last_updated,
+            ArticleVersion.crawled_at,
+        )
         .join(
             subquery,
             (ArticleVersion.article_id == subquery.c.article_id) & 
             (ArticleVersion.version_number == subquery.c.max_version)
         )
-        .filter(
+        .where(
             (ArticleVersion.headline.ilike(f"%{keyword}%")) |
             (ArticleVersion.subheadline.ilike(f"%{keyword}%")) |
             (ArticleVersion.full_text.ilike(f"%{keyword}%"))
         )
-        .all()
     )
 
-    result = [
-        {
-            "article_id": version.article_id,
-            "version_number": version.version_number,
-            "headline": version.headline,
-            "subheadline": version.subheadline,
-            "full_text": version.full_text,
-            "last_updated": version.last_updated.isoformat(),
-            "crawled_at": version.crawled_at.isoformat(),
-        }
-        for version in latest_versions
-    ]
-
-    return jsonify(result), 200
+    return json_response(result, 200)
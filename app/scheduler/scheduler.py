@@ -1,51 +1,61 @@
 """
 This module handles the scheduling of crawling tasks using the APScheduler library.
-The scheduler periodically runs the `start_full_crawl` function based on settings stored in the database.
+The scheduler periodically runs the `start_full_crawl` function based on settings stored in the database,
+and archives old article versions once a day.
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from app.crawler.crawler import start_full_crawl
+from app.archive.archive import archive_old_versions
 import logging
-from app import create_app
 from app.db.models import SchedulerSettings
 
 # Initialize the background scheduler
 scheduler = BackgroundScheduler()
 
-# Set up logging to track the scheduler's status
-logging.basicConfig(level=logging.INFO)
-
-def start_scheduler():
+def start_scheduler(app):
     """
     Starts the background scheduler based on settings stored in the database.
 
     The scheduler will execute the `start_full_crawl` function periodically with an interval defined 
-    by the `frequency_hours` setting from the `SchedulerSettings` table. The job is only added if the
-    scheduler is enabled in the database.
+    by the `frequency_hours` setting from the `SchedulerSettings` table. The crawl job is only added if
+    the scheduler is enabled in the database; the daily archive job is always added.
     
+    Must be called within an app context of `app`, which is also used to run the crawl jobs.
+
     Steps:
-    1. Creates a Flask app instance.
+    1. Adds the daily archive job.
     2. Fetches scheduler settings from the database.
-    3. If the scheduler is enabled, adds a job to the scheduler with the defined interval.
+    3. If the scheduler is enabled, adds the crawl job with the defined interval.
     4. Starts the scheduler.
     """
-    
-    app = create_app()  # Create the Flask app instance
 
     # Wrapper function to ensure start_full_crawl() runs within the Flask app context
     def run_in_app_context():
         with app.app_context():
             start_full_crawl()  # Call the crawling function
 
+    # Wrapper function to archive old versions within the Flask app context
+    def archive_in_app_context():
+        with app.app_context():
+            archive_old_versions()
+
+    # Archiving runs daily regardless of the crawl settings, so the hot table stays small
+    scheduler.add_job(
+        func=archive_in_app_context,
+        trigger="interval",
+        days=1,
+        id="daily_version_archive",
+        replace_existing=True
+    )
+
     # Fetch scheduler settings from the database
     settings = SchedulerSettings.query.first()
 
     if not settings:
         logging.error("Scheduler settings not found in the database.")
-        return  # Stop if settings are not found
-
     # Check if the scheduler is enabled and add the job if so
-    if settings.is_enabled:
+    elif settings.is_enabled:
         scheduler.add_job(
             func=run_in_app_context,
             trigger="interval",
@@ -53,7 +63,9 @@ def start_scheduler():
             id="hourly_overview_crawl",  # A unique identifier for the job
             replace_existing=True  # Ensure any existing job with the same ID is replaced
         )
-        scheduler.start()  # Start the scheduler
-        logging.info(f"Scheduler started with frequency {settings.frequency_hours} hours.")
+        logging.info(f"Crawl scheduled with frequency {settings.frequency_hours} hours.")
     else:
-        logging.info("Scheduler is disabled. No job will be scheduled.")  # Log if disabled
+        logging.info("Scheduler is disabled. No crawl job will be scheduled.")  # Log if disabled
+
+    scheduler.start()  # Start the scheduler
+    logging.info("Scheduler started.")
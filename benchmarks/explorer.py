@@ -0,0 +1,130 @@
+"""
+Benchmarks the /explorer/articles/<id>/versions endpoint against the previous ORM implementation.
+
+Seeds a temporary SQLite database with one article that has many large versions, then measures
+throughput (rows/s, best of several runs) and peak Python memory (tracemalloc) of:
+
+- **orm**: loads full ArticleVersion objects (including full_text), builds dicts by hand and uses jsonify.
+- **core**: the current row-tuple query of the returned columns only, serialized with orjson.
+
+Usage:
+    python benchmarks/explorer.py [--versions 20000] [--text-size 5000] [--runs 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def orm_versions(article_id):
+    """The previous implementation of `get_article_versions`, kept here as the baseline."""
+    from flask import jsonify
+    from app.db.models import ArticleVersion
+
+    versions = (
+        ArticleVersion.query
+        .filter_by(article_id=article_id)
+        .order_by(ArticleVersion.version_number.asc())
+        .all()
+    )
+    result = [
+        {
+            "id": version.id,
+            "version_number": version.version_number,
+            "headline": version.headline,
+            "subheadline": version.subheadline,
+            "last_updated": version.last_updated.isoformat(),
+            "crawled_at": version.crawled_at.isoformat(),
+        }
+        for version in versions
+    ]
+    return jsonify(result), 200
+
+
+def core_versions(article_id):
+    from app.explorer_api.explorer import get_article_versions
+
+    return get_article_versions(article_id)
+
+
+def seed(db, versions, text_size):
+    """Inserts one article with `versions` versions of `text_size` characters of full text."""
+    from app.db.models import Article, ArticleVersion
+
+    article = Article(url="https://www.tagesschau.de/benchmark.html")
+    db.session.add(article)
+    db.session.flush()
+
+    now = datetime.utcnow()
+    db.session.execute(
+        ArticleVersion.__table__.insert(),
+        [
+            {
+                "article_id": article.id,
+                "version_number": number,
+                "headline": f"Headline {number}",
+                "subheadline": f"Subheadline {number}",
+                "full_text": "x" * text_size,
+                "last_updated": now,
+                "crawled_at": now,
+                "content_hash": str(number),
+            }
+            for number in range(1, versions + 1)
+        ],
+    )
+    db.session.commit()
+    return article.id
+
+
+def measure(app, db, handler, article_id, versions, runs):
+    """Returns (rows per second, peak traced memory in MB) for one handler."""
+    timings = []
+    for _ in range(runs):
+        with app.test_request_context():
+            start = time.perf_counter()
+            response = app.make_response(handler(article_id))
+            response.get_data()
+            timings.append(time.perf_counter() - start)
+            db.session.remove()
+
+    with app.test_request_context():
+        tracemalloc.start()
+        response = app.make_response(handler(article_id))
+        response.get_data()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        db.session.remove()
+
+    return versions / min(timings), peak / 1024 / 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--versions", type=int, default=20000)
+    parser.add_argument("--text-size", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(tmp, 'benchmark.db')}"
+
+        from app import create_app
+        from app.db.models import db
+
+        app = create_app("api")
+        with app.app_context():
+            db.create_all()
+            article_id = seed(db, args.versions, args.text_size)
+
+        print(f"{args.versions} versions, {args.text_size} chars of full_text each")
+        print(f"{'path':<6} {'rows/s':>10} {'peak MB':>9}")
+        for name, handler in (("orm", orm_versions), ("core", core_versions)):
+            rows_per_second, peak_mb = measure(app, db, handler, article_id, args.versions, args.runs)
+            print(f"{name:<6} {rows_per_second:>10.0f} {peak_mb:>9.1f}")
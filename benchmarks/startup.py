@@ -0,0 +1,60 @@
+"""
+Measures cold-start time and peak RSS of the Flask app for each role.
+
+Every role is started in a fresh interpreter, which imports `app`, builds the app with
+`create_app(role)` and reports how long that took, its peak RSS, and whether the crawler
+dependencies (requests, BeautifulSoup, lxml) were imported.
+
+Usage:
+    SQLALCHEMY_DATABASE_URI=sqlite:///:memory: python benchmarks/startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from app import create_app
+create_app(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "crawler_loaded": any(name in sys.modules for name in ("requests", "bs4", "lxml")),
+}))
+"""
+
+
+def measure(role, runs):
+    """Starts the given role `runs` times and returns the median start time and peak RSS."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE, role],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    return {
+        "ms": statistics.median(sample["seconds"] for sample in samples) * 1000,
+        "rss_mb": statistics.median(sample["rss_mb"] for sample in samples),
+        "crawler_loaded": samples[0]["crawler_loaded"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'role':<8} {'start (ms)':>10} {'RSS (MB)':>9}  crawler loaded")
+    for role in ("api", "worker", "all"):
+        result = measure(role, args.runs)
+        print(f"{role:<8} {result['ms']:>10.0f} {result['rss_mb']:>9.1f}  {result['crawler_loaded']}")
@@ -7,4 +7,12 @@ load_dotenv()
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("SQLALCHEMY_DATABASE_URI")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SECRET_KEY = os.getenv('SECRET_KEY', 'default-secret-key')
\ No newline at end of file
+    SECRET_KEY = os.getenv('SECRET_KEY', 'default-secret-key')
+    APP_ROLE = os.getenv('APP_ROLE', 'all')
+    CRAWL_BATCH_MAX_URLS = int(os.getenv('CRAWL_BATCH_MAX_URLS', 500))
+    CRAWL_BATCH_MAX_WORKERS = int(os.getenv('CRAWL_BATCH_MAX_WORKERS', 8))
+    CRAWL_REQUEST_TIMEOUT_SECONDS = float(os.getenv('CRAWL_REQUEST_TIMEOUT_SECONDS', 10))
+    QUARANTINE_BASE_BACKOFF_HOURS = float(os.getenv('QUARANTINE_BASE_BACKOFF_HOURS', 1))
+    QUARANTINE_MAX_BACKOFF_HOURS = float(os.getenv('QUARANTINE_MAX_BACKOFF_HOURS', 168))
+    ARCHIVE_DIR = os.getenv('ARCHIVE_DIR', 'archive')
+    ARCHIVE_MAX_AGE_DAYS = int(os.getenv('ARCHIVE_MAX_AGE_DAYS', 365))
@@ -1,20 +1,46 @@
 """
 This module sets up the Flask application and handles database setup and scheduler initialization.
 
-- Initializes the Flask app using the factory function `create_app()`.
-- Creates the database tables if they don't exist.
-- Starts the scheduler for scheduled background tasks like crawling.
+The role is taken from the APP_ROLE environment variable (see `app.create_app`):
+
+- **all** (default): Serves every endpoint and runs the crawl scheduler in one process.
+- **worker**: Serves the controller endpoints and runs the crawl scheduler.
+- **api**: Serves the read-only explorer endpoints only; never imports the crawler or starts jobs.
+
+Importing this module (e.g. from a WSGI server) only builds the app. Table creation and the
+scheduler are started by `init_background_tasks`, which runs when the module is executed.
 """
 
+import logging
+import os
 from app import create_app
 from app.db.models import db
-from app.scheduler.scheduler import start_scheduler
+
+# Basic logging to track the app's activity
+logging.basicConfig(level=logging.INFO)
 
 app = create_app()  # Initialize Flask app using the factory function
 
-with app.app_context():  # Ensure that the app context is active for database setup
-    db.create_all()  # Creates all tables defined in the models (Article, ArticleVersion, etc.) if they do not exist
-    start_scheduler()  # Initializes and starts the scheduler for background tasks like crawling
+
+def init_background_tasks(app):
+    """
+    Creates the database tables and starts the crawl scheduler, for roles that run the crawler.
+    The scheduler module is imported lazily so the api role never loads the crawler.
+    """
+    if app.config["APP_ROLE"] == "api":
+        return
+
+    from app.scheduler.scheduler import start_scheduler
+
+    with app.app_context():  # Ensure that the app context is active for database setup
+        db.create_all()  # Creates all tables defined in the models (Article, ArticleVersion, etc.) if they do not exist
+        start_scheduler(app)  # Initializes and starts the scheduler for background tasks like crawling
+
 
 if __name__ == "__main__":
+    # With debug=True the Werkzeug reloader executes this module twice: once in a watcher process
+    # and once in the serving child, which has WERKZEUG_RUN_MAIN set. Only the serving process
+    # starts background tasks, so a single scheduler runs.
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        init_background_tasks(app)
     app.run(debug=True)  # Runs the app with debugging enabled (useful in development)
@@ -0,0 +1,41 @@
+# tests/test_app.py
+from unittest.mock import patch
+
+import pytest
+
+from app import create_app
+from app.db.models import SchedulerSettings, db
+from app.scheduler.scheduler import scheduler, start_scheduler
+
+
+def registered_blueprints(role):
+    return set(create_app(role).blueprints)
+
+
+def test_api_role_serves_explorer_only():
+    assert registered_blueprints("api") == {"explorer", "swagger_ui"}
+
+
+def test_worker_role_serves_controller_only():
+    assert registered_blueprints("worker") == {"controller", "swagger_ui"}
+
+
+def test_all_role_serves_everything():
+    assert registered_blueprints("all") == {"controller", "explorer", "swagger_ui"}
+
+
+def test_unknown_role_is_rejected():
+    with pytest.raises(ValueError):
+        create_app("replica")
+
+
+def test_archive_job_is_scheduled_when_crawling_is_disabled(app):
+    db.session.add(SchedulerSettings(frequency_hours=1, is_enabled=False))
+    db.session.commit()
+
+    with patch.object(scheduler, "start"):
+        start_scheduler(app)
+
+    job_ids = {job.id for job in scheduler.get_jobs()}
+    scheduler.remove_all_jobs()
+    assert job_ids == {"daily_version_archive"}
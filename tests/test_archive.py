@@ -0,0 +1,124 @@
+# tests/test_archive.py
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.archive import archive
+from app.archive.archive import archive_old_versions, load_archived_versions
+from app.db.models import Article, ArticleVersion, ArchiveSegment, db
+
+
+@pytest.fixture
+def article(app, tmp_path):
+    app.config["ARCHIVE_DIR"] = str(tmp_path)
+
+    article = Article(url="http://example.com/article")
+    db.session.add(article)
+    db.session.flush()
+    for number in (1, 2, 3):
+        db.session.add(ArticleVersion(
+            article_id=article.id,
+            version_number=number,
+            headline=f"Headline {number}",
+            subheadline=f"Subheadline {number}",
+            full_text=f"Full text {number}",
+            last_updated=datetime(2024, 1, number, 12, 0),
+            crawled_at=datetime(2024, 1, number, 12, 30),
+        ))
+    db.session.commit()
+    return article
+
+
+def test_archive_keeps_latest_version_hot(article, tmp_path):
+    archived = archive_old_versions(max_age_days=30)
+
+    assert archived == {"articles": 1, "versions": 2}
+    assert [version.version_number for version in ArticleVersion.query.all()] == [3]
+
+    segment = ArchiveSegment.query.one()
+    assert (segment.min_version, segment.max_version, segment.version_count) == (1, 2, 2)
+    assert os.path.exists(tmp_path / segment.path)
+
+    versions = load_archived_versions(article.id)
+    assert [version["full_text"] for version in versions] == ["Full text 1", "Full text 2"]
+    assert versions[0]["last_updated"] == datetime(2024, 1, 1, 12, 0)
+
+
+def test_archive_skips_recent_versions(article):
+    now = datetime(2024, 1, 2, 12, 30) + timedelta(days=10)
+    assert archive_old_versions(max_age_days=10, now=now) == {"articles": 1, "versions": 1}
+    assert archive_old_versions(max_age_days=10, now=now) == {"articles": 0, "versions": 0}
+    assert ArticleVersion.query.count() == 2
+
+
+def test_explorer_sees_archived_versions(client, article):
+    before_versions = client.get(f"/explorer/articles/{article.id}/versions").json
+    before_compare = client.get(f"/explorer/articles/{article.id}/compare").json
+
+    response = client.post("/controller/archive", json={"max_age_days": 30})
+    assert response.status_code == 200
+    assert response.json == {"message": "Old versions archived.", "articles": 1, "versions": 2}
+
+    assert client.get(f"/explorer/articles/{article.id}/versions").json == before_versions
+    assert client.get(f"/explorer/articles/{article.id}/compare").json == before_compare
+
+
+def test_trigger_archive_rejects_invalid_age(client):
+    response = client.post("/controller/archive", json={"max_age_days": -1})
+    assert response.status_code == 400
+
+
+def test_explorer_reports_unreadable_archive(client, article, tmp_path):
+    archive_old_versions(max_age_days=30)
+    os.remove(tmp_path / ArchiveSegment.query.one().path)
+
+    for endpoint in ("versions", "compare"):
+        response = client.get(f"/explorer/articles/{article.id}/{endpoint}")
+        assert response.status_code == 503
+        assert response.json == {"error": "Archived versions of this article are unavailable"}
+
+
+def test_explorer_deduplicates_versions_archived_during_read(client, article):
+    before = client.get(f"/explorer/articles/{article.id}/versions").json
+    hot_rows = [
+        {column.key: getattr(version, column.key) for column in ArticleVersion.__table__.columns}
+        for version in ArticleVersion.query.all()
+    ]
+    archive_old_versions(max_age_days=30)
+
+    # Put the archived rows back, as if the hot table had been read before the archive committed
+    db.session.execute(
+        ArticleVersion.__table__.insert(),
+        [row for row in hot_rows if row["version_number"] < 3],
+    )
+    db.session.commit()
+
+    assert client.get(f"/explorer/articles/{article.id}/versions").json == before
+
+
+def test_trigger_archive_rejects_non_object_body(client):
+    response = client.post("/controller/archive", json=[1])
+    assert response.status_code == 400
+
+
+def test_overlapping_archive_runs_keep_the_committed_segment(client, article):
+    write_segment = archive._write_segment
+    overlapped = []
+
+    def write_after_concurrent_run(relative_path, versions):
+        # A second run archives everything between this run's SELECT and its write
+        if not overlapped:
+            overlapped.append(None)
+            overlapped[0] = archive_old_versions(max_age_days=30)
+        return write_segment(relative_path, versions)
+
+    before = client.get(f"/explorer/articles/{article.id}/versions").json
+    with patch("app.archive.archive._write_segment", side_effect=write_after_concurrent_run):
+        assert archive_old_versions(max_age_days=30) == {"articles": 0, "versions": 0}
+
+    assert overlapped == [{"articles": 1, "versions": 2}]
+    assert [version.version_number for version in ArticleVersion.query.all()] == [3]
+    assert len(os.listdir(os.path.join(client.application.config["ARCHIVE_DIR"], str(article.id)))) == 1
+    assert client.get(f"/explorer/articles/{article.id}/versions").json == before
@@ -1,4 +1,5 @@
 # tests/test_controller.py
+import json
 from unittest.mock import patch
 
 def test_trigger_full_crawl(client):
@@ -35,3 +36,65 @@ def test_trigger_article_crawl_failed_crawl(client):
         response = client.post("/controller/crawl/article", json={"url": "http://fake.url"})
         assert response.status_code == 500
         assert response.json == {"error": "Failed to crawl the article"}
+
+def test_trigger_batch_article_crawl(client):
+    def fake_crawl(url, timeout=None):
+        if url.endswith("broken"):
+            return []
+        return {
+            "headline": "Test Headline",
+            "subheadline": "Test Subheadline",
+            "full_text": "Same text" if url.endswith("same") else f"Text for {url}",
+            "url": url,
+        }
+
+    urls = ["http://example.com/a", "http://example.com/broken", "http://example.com/same"]
+    with patch("app.crawler.crawler.crawl_article_page", side_effect=fake_crawl):
+        client.post("/controller/crawl/articles", json={"urls": ["http://example.com/same"]})
+        response = client.post("/controller/crawl/articles", json={"urls": urls})
+
+    assert response.status_code == 200
+    assert response.json["results"] == [
+        {"url": "http://example.com/a", "status": "changed"},
+        {"url": "http://example.com/broken", "status": "failed", "reason": "Failed to crawl the article"},
+        {"url": "http://example.com/same", "status": "unchanged"},
+    ]
+    assert response.json["summary"] == {"changed": 1, "unchanged": 1, "failed": 1}
+
+def test_trigger_batch_article_crawl_stream(client):
+    mock_data = {"headline": "H", "subheadline": "S", "full_text": "Body", "url": "http://example.com/a"}
+    with patch("app.crawler.crawler.crawl_article_page", return_value=mock_data):
+        response = client.post(
+            "/controller/crawl/articles",
+            json={"urls": ["http://example.com/a"], "stream": True},
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"url": "http://example.com/a", "status": "changed"},
+        {"committed": True},
+    ]
+
+def test_trigger_batch_article_crawl_stream_reports_rollback(client):
+    mock_data = {"headline": "H", "subheadline": "S", "full_text": "Body", "url": "http://example.com/a"}
+    with patch("app.crawler.crawler.crawl_article_page", return_value=mock_data), \
+            patch("app.crawler.crawler.db.session.commit", side_effect=RuntimeError("boom")):
+        response = client.post(
+            "/controller/crawl/articles",
+            json={"urls": ["http://example.com/a"], "stream": True},
+        )
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert lines[-1] == {"committed": False, "error": "RuntimeError: boom"}
+    assert client.get("/explorer/articles").json == []
+
+def test_trigger_batch_article_crawl_missing_urls(client):
+    response = client.post("/controller/crawl/articles", json={"urls": []})
+    assert response.status_code == 400
+    assert response.json == {"error": "A non-empty list of URLs is required"}
+
+def test_trigger_batch_article_crawl_rejects_non_object_body(client):
+    response = client.post("/controller/crawl/articles", json=["http://example.com/a"])
+    assert response.status_code == 400
+    assert response.json == {"error": "A non-empty list of URLs is required"}
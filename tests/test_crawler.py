@@ -0,0 +1,144 @@
+# tests/test_crawler.py
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.crawler import crawler
+from app.crawler.crawler import ArticleParseError, crawl_article_page, start_full_crawl
+from app.db.models import ArticleVersion, QuarantinedUrl
+
+ARTICLE_HTML = """
+<html><head>
+<meta property="og:title" content="Headline">
+<meta property="og:description" content="Subheadline">
+<script type="application/ld+json">{"@type": "BreadcrumbList"}</script>
+<script type="application/ld+json">not json</script>
+<script type="application/ld+json">[{"@graph": [{"@type": "NewsArticle", "articleBody": " Body text "}]}]</script>
+</head><body></body></html>
+"""
+
+LIVE_BLOG_HTML = """
+<html><head><title>Liveblog</title>
+<script type="application/ld+json">{"@type": "LiveBlogPosting"}</script>
+</head><body></body></html>
+"""
+
+
+def fake_response(text, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    return response
+
+
+def test_crawl_article_page_handles_multiple_json_ld_blocks(app):
+    with patch("app.crawler.crawler.requests.get", return_value=fake_response(ARTICLE_HTML)):
+        article_data = crawl_article_page("http://example.com/a")
+
+    assert article_data["headline"] == "Headline"
+    assert article_data["subheadline"] == "Subheadline"
+    assert article_data["full_text"] == "Body text"
+
+
+def test_crawl_article_page_raises_parse_error_without_article_body(app):
+    with patch("app.crawler.crawler.requests.get", return_value=fake_response(LIVE_BLOG_HTML)):
+        with pytest.raises(ArticleParseError):
+            crawl_article_page("http://example.com/live")
+
+
+def test_full_crawl_isolates_and_quarantines_failing_urls(app):
+    pages = {"http://example.com/live": LIVE_BLOG_HTML, "http://example.com/a": ARTICLE_HTML}
+    links = list(pages)
+
+    with patch("app.crawler.crawler.crawl_links_overview_page", return_value=links), \
+            patch("app.crawler.crawler.requests.get", side_effect=lambda url, timeout: fake_response(pages[url])) as mock_get:
+        start_full_crawl()
+
+        entry = QuarantinedUrl.query.filter_by(url="http://example.com/live").one()
+        assert entry.error_type == "ArticleParseError"
+        assert entry.failure_count == 1
+        assert entry.next_retry_at > datetime.utcnow()
+        assert ArticleVersion.query.count() == 1
+
+        # The quarantined URL is not fetched again until its backoff expires
+        mock_get.reset_mock()
+        start_full_crawl()
+        mock_get.assert_called_once_with("http://example.com/a", timeout=app.config["CRAWL_REQUEST_TIMEOUT_SECONDS"])
+
+
+def test_quarantine_backoff_doubles_and_is_capped(app):
+    for _ in range(10):
+        entry = crawler.quarantine_url("http://example.com/bad", "FetchError", "Failed to crawl the article")
+    hours = (entry.next_retry_at - entry.last_failed_at).total_seconds() / 3600
+
+    assert entry.failure_count == 10
+    assert hours == app.config["QUARANTINE_MAX_BACKOFF_HOURS"]
+
+
+def test_recrawl_cancels_pending_fetches_when_closed_early(app):
+    release = threading.Event()
+    fetched = []
+
+    def fake_crawl(url, timeout=None):
+        if url.endswith("broken"):
+            return []
+        release.wait(timeout=5)
+        fetched.append(url)
+        return {"headline": "H", "subheadline": "S", "full_text": "Body", "url": url}
+
+    urls = ["http://example.com/broken"] + [f"http://example.com/{number}" for number in range(5)]
+    with patch("app.crawler.crawler.crawl_article_page", side_effect=fake_crawl):
+        outcomes = crawler.recrawl_articles(urls, max_workers=2)
+        assert next(outcomes)["status"] == "failed"
+
+        start = time.perf_counter()
+        outcomes.close()
+        assert time.perf_counter() - start < 1
+
+        release.set()
+
+    # Only the fetches already running when the batch was closed complete; nothing is stored
+    time.sleep(0.1)
+    assert len(fetched) <= 2
+    assert ArticleVersion.query.count() == 0
+
+
+def test_single_article_crawl_quarantines_and_releases(client):
+    url = "http://example.com/live"
+    with patch("app.crawler.crawler.requests.get", return_value=fake_response(LIVE_BLOG_HTML)):
+        response = client.post("/controller/crawl/article", json={"url": url})
+    assert response.status_code == 422
+    assert QuarantinedUrl.query.filter_by(url=url).one().error_type == "ArticleParseError"
+
+    with patch("app.crawler.crawler.requests.get", return_value=fake_response(ARTICLE_HTML)):
+        response = client.post("/controller/crawl/article", json={"url": url})
+    assert response.status_code == 200
+    assert QuarantinedUrl.query.filter_by(url=url).count() == 0
+
+
+def test_single_article_crawl_quarantines_fetch_errors(client):
+    response = client.post("/controller/crawl/article", json={"url": "not-a-url"})
+
+    assert response.status_code == 500
+    assert response.json["error"] == "Failed to crawl the article"
+    assert response.json["reason"].startswith("MissingSchema")
+    assert QuarantinedUrl.query.filter_by(url="not-a-url").one().error_type == "MissingSchema"
+
+
+def test_recrawl_keeps_quarantine_when_batch_is_rolled_back(app):
+    def fake_crawl(url, timeout=None):
+        if url.endswith("broken"):
+            return []
+        return {"headline": "H", "subheadline": "S", "full_text": "Body", "url": url}
+
+    urls = ["http://example.com/broken", "http://example.com/a"]
+    with patch("app.crawler.crawler.crawl_article_page", side_effect=fake_crawl), \
+            patch("app.crawler.crawler._stage_article_version", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            list(crawler.recrawl_articles(urls, max_workers=1))
+
+    assert QuarantinedUrl.query.filter_by(url="http://example.com/broken").count() == 1
+    assert ArticleVersion.query.count() == 0
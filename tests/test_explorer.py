@@ -0,0 +1,73 @@
+# tests/test_explorer.py
+from datetime import datetime
+
+import pytest
+
+from app.db.models import Article, ArticleVersion, db
+
+
+@pytest.fixture
+def article(app):
+    article = Article(url="http://example.com/article")
+    db.session.add(article)
+    db.session.flush()
+    for number in (1, 2, 3):
+        db.session.add(ArticleVersion(
+            article_id=article.id,
+            version_number=number,
+            headline=f"Headline {number}",
+            subheadline=f"Subheadline {number}",
+            full_text=f"Full text {number}",
+            last_updated=datetime(2024, 1, number, 12, 0),
+            crawled_at=datetime(2024, 1, number, 12, 30),
+        ))
+    db.session.commit()
+    return article
+
+
+def test_list_articles(client, article):
+    response = client.get("/explorer/articles")
+    assert response.status_code == 200
+    assert response.json == [{"id": article.id, "url": "http://example.com/article"}]
+
+
+def test_get_article_versions(client, article):
+    response = client.get(f"/explorer/articles/{article.id}/versions")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert [version["version_number"] for version in response.json] == [1, 2, 3]
+    assert response.json[0] == {
+        "id": response.json[0]["id"],
+        "version_number": 1,
+        "headline": "Headline 1",
+        "subheadline": "Subheadline 1",
+        "last_updated": "2024-01-01T12:00:00",
+        "crawled_at": "2024-01-01T12:30:00",
+    }
+
+
+def test_get_article_versions_not_found(client):
+    response = client.get("/explorer/articles/999/versions")
+    assert response.status_code == 404
+    assert response.json == {"error": "No versions found for this article"}
+
+
+def test_compare_article_versions(client, article):
+    response = client.get(f"/explorer/articles/{article.id}/compare")
+    assert response.status_code == 200
+    assert response.json["version_1"] == {
+        "version_number": 3,
+        "headline": "Headline 3",
+        "subheadline": "Subheadline 3",
+        "full_text": "Full text 3",
+    }
+    assert response.json["version_2"]["version_number"] == 2
+
+
+def test_search_articles_matches_latest_version_only(client, article):
+    assert client.get("/explorer/articles/search?q=Full text 1").json == []
+
+    response = client.get("/explorer/articles/search?q=Full text 3")
+    assert response.status_code == 200
+    assert [version["version_number"] for version in response.json] == [3]
+    assert response.json[0]["last_updated"] == "2024-01-03T12:00:00"